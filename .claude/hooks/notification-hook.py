@@ -21,6 +21,13 @@ import urllib.error
 # Read webhook URL from environment variable
 POKE_WEBHOOK_URL = os.environ.get("POKE_WEBHOOK_URL", "")
 
+# Keep well under the 10s hook timeout in settings.json so a slow ntfy
+# server can't hold Claude up for the whole hook budget
+REQUEST_TIMEOUT_SECONDS = 3
+
+# Hook payloads are small JSON blobs; don't buffer more than this
+MAX_HOOK_INPUT_BYTES = 1 << 20
+
 
 def send_notification(title: str, body: str, priority: int = 0) -> None:
     """Send push notification via ntfy.sh webhook."""
@@ -43,7 +50,7 @@ def send_notification(title: str, body: str, priority: int = 0) -> None:
             },
             method="POST",
         )
-        with urllib.request.urlopen(req, timeout=10) as response:
+        with urllib.request.urlopen(req, timeout=REQUEST_TIMEOUT_SECONDS) as response:
             if response.status == 200:
                 print(f"✓ Notification sent: {title}", file=sys.stderr)
             else:
@@ -107,7 +114,9 @@ def main() -> None:
 
     # Otherwise, read JSON from stdin (hook usage)
     try:
-        hook_input = sys.stdin.read().strip()
+        # Read raw bytes so the size cap counts bytes; json.loads accepts
+        # bytes and does the UTF-8 decode itself
+        hook_input = sys.stdin.buffer.read(MAX_HOOK_INPUT_BYTES).strip()
 
         if not hook_input:
             return
@@ -124,8 +133,9 @@ def main() -> None:
             # Unknown hook type
             pass
 
-    except json.JSONDecodeError:
-        # Not JSON input, ignore
+    except ValueError:
+        # Not JSON, or not UTF-8 (the size cap can cut a multibyte
+        # character in half); ignore either way
         pass
     except Exception as e:
         print(f"⚠️  Hook error: {e}", file=sys.stderr)
@@ -10,11 +10,58 @@ Enforces:
 
 import json
 import os
+import re
+import shlex
 import subprocess
 import sys
+import tempfile
+import time
+
+# Split on whitespace and shell operators so `a&&git commit` still tokenizes
+TOKEN_SPLIT_RE = re.compile(r"[\s;&|()]+")
+
+def tokenize_command(command):
+    """Split a shell command into unquoted tokens.
+
+    shlex strips quotes, so `git push origin "main"` yields `main`. Each
+    word is then split again on whitespace and shell operators so that
+    `a&&git commit` and `bash -c "git commit -m x"` both yield adjacent
+    `git`, `commit` tokens. Unbalanced quotes fall back to the plain split.
+    """
+    try:
+        words = shlex.split(command, posix=True)
+    except ValueError:
+        words = [command]
+    return [token for word in words for token in TOKEN_SPLIT_RE.split(word) if token]
+
+def is_git_command(tokens, subcommand):
+    """Check whether `git <subcommand>` appears in the tokenized command."""
+    return ("git", subcommand) in zip(tokens, tokens[1:])
+
+def targets_main(tokens):
+    """Check whether any token names main/master as a push destination.
+
+    Matches `main`, `HEAD:main`, `+main` and `refs/heads/main`, but not
+    names that merely contain it like `main.py` or `feature/main-fix`.
+    """
+    for token in tokens:
+        ref = token.lstrip("+").rsplit(":", 1)[-1]
+        if ref.removeprefix("refs/heads/") in ("main", "master"):
+            return True
+    return False
 
 def get_current_branch():
     """Get the current git branch name."""
+    # Read HEAD directly to avoid spawning git on every hook call
+    try:
+        with open(".git/HEAD") as f:
+            head = f.read().strip()
+        if head.startswith("ref: refs/heads/"):
+            return head[len("ref: refs/heads/"):]
+        return ""  # Detached HEAD, same as `git branch --show-current`
+    except OSError:
+        pass  # Worktree (.git is a file) or not at the repo root
+
     try:
         result = subprocess.run(
             ["git", "branch", "--show-current"],
@@ -26,8 +73,65 @@ def get_current_branch():
     except Exception:
         return None
 
-def check_deno_tests():
-    """Run deno tests if deno.json exists in supabase functions."""
+def get_changed_paths():
+    """List staged, unstaged and untracked paths, or None if git fails.
+
+    Unstaged paths count too: in `git add -A && git commit` the add runs
+    after this hook, so nothing is staged yet when we look.
+    """
+    try:
+        result = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=all"],
+            capture_output=True,
+            text=True,
+            timeout=3
+        )
+    except Exception:
+        return None
+    if result.returncode != 0:
+        return None
+    paths = []
+    for line in result.stdout.splitlines():
+        # "XY path" or "XY old -> new" for renames; keep both sides
+        for path in line[3:].split(" -> "):
+            paths.append(path.strip('"'))
+    return paths
+
+def touches_deno_code():
+    """Check whether the pending changes include anything under supabase/functions."""
+    paths = get_changed_paths()
+    if paths is None:
+        return True  # Can't tell, so run the checks
+    return any(path.startswith("supabase/functions/") for path in paths)
+
+# Skip deno's background update check; it only adds startup latency here
+DENO_ENV = {**os.environ, "DENO_NO_UPDATE_CHECK": "1"}
+
+def start_check(cmd, cwd, timeout):
+    """Start a check process in the background.
+
+    stderr goes to a temp file rather than a pipe, so a chatty process never
+    blocks on a full pipe while we wait on the other one. The deadline is
+    fixed at start time, so each timeout covers the process's whole run
+    rather than starting when we begin waiting on it.
+
+    Returns (process, stderr file, deadline, timeout).
+    """
+    stderr_file = tempfile.TemporaryFile(mode="w+", encoding="utf-8", errors="replace")
+    proc = subprocess.Popen(
+        cmd,
+        stdout=subprocess.DEVNULL,  # Only stderr is reported on failure
+        stderr=stderr_file,
+        cwd=cwd,
+        env=DENO_ENV
+    )
+    return proc, stderr_file, time.monotonic() + timeout, timeout
+
+def start_deno_tests():
+    """Start deno tests if deno.json exists in supabase functions.
+
+    Returns the running check, or None if there is nothing to test.
+    """
     test_paths = [
         "supabase/functions/telegram-webhook/deno.json",
         "supabase/functions/deno.json",
@@ -36,51 +140,88 @@ def check_deno_tests():
     for path in test_paths:
         if os.path.exists(path):
             print("Running deno tests...", file=sys.stderr)
-            result = subprocess.run(
+            return start_check(
                 ["deno", "test", "--allow-all"],
-                capture_output=True,
-                text=True,
-                timeout=120,
-                cwd=os.path.dirname(path) or "."
+                cwd=os.path.dirname(path) or ".",
+                timeout=120
             )
-            if result.returncode != 0:
-                print(f"Tests failed:\n{result.stderr}", file=sys.stderr)
-                return False
-            print("Tests passed!", file=sys.stderr)
-            return True
     
     # No test config found, skip
-    return True
+    return None
 
-def check_deno_lint():
-    """Run deno lint if deno.json exists."""
+def start_deno_lint():
+    """Start deno lint if deno.json exists.
+
+    Returns the running check, or None if there is nothing to lint.
+    """
     if os.path.exists("supabase/functions/telegram-webhook/deno.json"):
         print("Running deno lint...", file=sys.stderr)
-        result = subprocess.run(
+        return start_check(
             ["deno", "lint"],
-            capture_output=True,
-            text=True,
-            timeout=30,
-            cwd="supabase/functions/telegram-webhook"
+            cwd="supabase/functions/telegram-webhook",
+            timeout=30
         )
-        if result.returncode != 0:
-            print(f"Linting failed:\n{result.stderr}", file=sys.stderr)
-            return False
-        print("Linting passed!", file=sys.stderr)
+    return None
+
+def wait_for(check):
+    """Wait for a check to finish and return its stderr.
+
+    Kills the process and re-raises TimeoutExpired if it runs past its
+    deadline.
+    """
+    proc, stderr_file, deadline, timeout = check
+    try:
+        proc.wait(timeout=max(0, deadline - time.monotonic()))
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+        raise subprocess.TimeoutExpired(proc.args, timeout) from None
+    stderr_file.seek(0)
+    return stderr_file.read()
+
+def stop_check(check):
+    """Kill a check if it is still running and close its stderr file."""
+    proc, stderr_file, _, _ = check
+    if proc.poll() is None:
+        proc.kill()
+        proc.wait()
+    stderr_file.close()
+
+def check_deno_tests(check):
+    """Wait for deno tests started by start_deno_tests()."""
+    if check is None:
+        return True
+    stderr = wait_for(check)
+    if check[0].returncode != 0:
+        print(f"Tests failed:\n{stderr}", file=sys.stderr)
+        return False
+    print("Tests passed!", file=sys.stderr)
+    return True
+
+def check_deno_lint(check):
+    """Wait for deno lint started by start_deno_lint()."""
+    if check is None:
+        return True
+    stderr = wait_for(check)
+    if check[0].returncode != 0:
+        print(f"Linting failed:\n{stderr}", file=sys.stderr)
+        return False
+    print("Linting passed!", file=sys.stderr)
     return True
 
 def main():
     # Read input from Claude Code
     try:
-        input_data = json.load(sys.stdin)
+        input_data = json.loads(sys.stdin.buffer.read())
     except json.JSONDecodeError:
         sys.exit(0)  # No input, allow
 
     command = input_data.get("tool_input", {}).get("command", "")
 
     # Check if this is a git commit or push command
-    is_commit = "git commit" in command
-    is_push = "git push" in command and "origin" in command
+    tokens = tokenize_command(command)
+    is_commit = is_git_command(tokens, "commit")
+    is_push = is_git_command(tokens, "push") and "origin" in tokens
 
     if not (is_commit or is_push):
         sys.exit(0)  # Not a commit/push, allow
@@ -105,7 +246,7 @@ def main():
         
         # Allow pushing if we're pushing a different branch to origin
         # But block `git push origin main`
-        if is_push and ("main" in command or "master" in command):
+        if is_push and targets_main(tokens):
             print(
                 "\n❌ BLOCKED: Cannot push directly to main.\n"
                 "Create a PR instead.\n",
@@ -115,13 +256,27 @@ def main():
     
     # Run tests before commits
     if is_commit:
-        if not check_deno_tests():
-            print("\n❌ BLOCKED: Tests must pass before committing.\n", file=sys.stderr)
-            sys.exit(2)
-        
-        if not check_deno_lint():
-            print("\n❌ BLOCKED: Linting must pass before committing.\n", file=sys.stderr)
-            sys.exit(2)
+        # Tests and lint don't depend on each other, so run them side by side
+        if touches_deno_code():
+            tests = start_deno_tests()
+            lint = start_deno_lint()
+        else:
+            print("No supabase/functions changes, skipping deno checks.", file=sys.stderr)
+            tests = lint = None
+
+        try:
+            if not check_deno_tests(tests):
+                print("\n❌ BLOCKED: Tests must pass before committing.\n", file=sys.stderr)
+                sys.exit(2)
+            
+            if not check_deno_lint(lint):
+                print("\n❌ BLOCKED: Linting must pass before committing.\n", file=sys.stderr)
+                sys.exit(2)
+        finally:
+            # Never leave a check running, whether we pass, block or crash
+            for check in (tests, lint):
+                if check is not None:
+                    stop_check(check)
     
     # All checks passed
     sys.exit(0)
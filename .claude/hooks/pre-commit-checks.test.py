@@ -0,0 +1,163 @@
+"""Tests for pre-commit-checks.py command parsing and git helpers."""
+
+import unittest
+import sys
+import os
+import subprocess
+import tempfile
+from unittest import mock
+
+# Add hook directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from importlib import import_module
+
+# Import the module (handles hyphen in filename)
+hook = import_module("pre-commit-checks")
+
+
+class TestIsGitCommand(unittest.TestCase):
+    """Tests for tokenize_command + is_git_command."""
+
+    def is_command(self, command, subcommand):
+        return hook.is_git_command(hook.tokenize_command(command), subcommand)
+
+    def test_plain_commit(self):
+        """Plain git commit should be detected."""
+        self.assertTrue(self.is_command('git commit -m "msg"', "commit"))
+
+    def test_chained_without_spaces(self):
+        """Commit after && with no surrounding spaces should be detected."""
+        self.assertTrue(self.is_command("git add .&&git commit -m x", "commit"))
+
+    def test_quoted_inside_bash_c(self):
+        """Commit inside a quoted bash -c script should be detected."""
+        self.assertTrue(self.is_command('bash -c "git commit -m x"', "commit"))
+
+    def test_quoted_origin(self):
+        """Quoted remote name should still count as a push to origin."""
+        tokens = hook.tokenize_command('git push "origin" main')
+        self.assertTrue(hook.is_git_command(tokens, "push"))
+        self.assertIn("origin", tokens)
+
+    def test_unbalanced_quotes_fall_back(self):
+        """Unbalanced quotes should fall back to the plain split."""
+        self.assertTrue(self.is_command('git commit -m "oops', "commit"))
+
+    def test_not_git(self):
+        """Other commands should not be detected."""
+        self.assertFalse(self.is_command("python main.py", "commit"))
+        self.assertFalse(self.is_command("git status", "commit"))
+
+
+class TestTargetsMain(unittest.TestCase):
+    """Tests for tokenize_command + targets_main."""
+
+    def targets(self, command):
+        return hook.targets_main(hook.tokenize_command(command))
+
+    def test_plain_main_and_master(self):
+        """Bare main/master destinations should be blocked."""
+        self.assertTrue(self.targets("git push origin main"))
+        self.assertTrue(self.targets("git push origin master"))
+
+    def test_quoted_ref(self):
+        """Quoted main/master destinations should be blocked."""
+        self.assertTrue(self.targets('git push origin "main"'))
+        self.assertTrue(self.targets("git push origin 'master'"))
+
+    def test_refspec_forms(self):
+        """HEAD:main, +main and refs/heads/main should be blocked."""
+        self.assertTrue(self.targets("git push origin HEAD:main"))
+        self.assertTrue(self.targets("git push origin +main"))
+        self.assertTrue(self.targets("git push origin refs/heads/main"))
+
+    def test_names_containing_main(self):
+        """Branches or files that merely contain main should be allowed."""
+        self.assertFalse(self.targets("git push origin feature/main-fix"))
+        self.assertFalse(self.targets("git push origin feat && python main.py"))
+
+
+def git_status(stdout, returncode=0):
+    """Build a fake `git status --porcelain` result."""
+    return subprocess.CompletedProcess(
+        args=["git", "status"], returncode=returncode, stdout=stdout, stderr=""
+    )
+
+
+class TestChangedPaths(unittest.TestCase):
+    """Tests for get_changed_paths + touches_deno_code."""
+
+    def run_with(self, result):
+        with mock.patch.object(hook.subprocess, "run", return_value=result):
+            return hook.get_changed_paths(), hook.touches_deno_code()
+
+    def test_docs_only_change_skips_checks(self):
+        """Changes outside supabase/functions should skip the deno checks."""
+        paths, touches = self.run_with(git_status(" M README.md\n?? docs/new.md\n"))
+        self.assertEqual(paths, ["README.md", "docs/new.md"])
+        self.assertFalse(touches)
+
+    def test_rename_into_functions(self):
+        """Both sides of a rename should be listed."""
+        paths, touches = self.run_with(
+            git_status("R  lib/a.ts -> supabase/functions/_shared/a.ts\n")
+        )
+        self.assertEqual(paths, ["lib/a.ts", "supabase/functions/_shared/a.ts"])
+        self.assertTrue(touches)
+
+    def test_quoted_path(self):
+        """Quoted paths (e.g. with spaces) should have quotes stripped."""
+        paths, touches = self.run_with(
+            git_status('?? "supabase/functions/new file.ts"\n')
+        )
+        self.assertEqual(paths, ["supabase/functions/new file.ts"])
+        self.assertTrue(touches)
+
+    def test_git_failure_runs_checks(self):
+        """A nonzero git exit should return None and run the checks."""
+        paths, touches = self.run_with(git_status("", returncode=128))
+        self.assertIsNone(paths)
+        self.assertTrue(touches)
+
+
+class TestGetCurrentBranch(unittest.TestCase):
+    """Tests for get_current_branch."""
+
+    def setUp(self):
+        self.old_cwd = os.getcwd()
+        self.tmpdir = tempfile.TemporaryDirectory()
+        os.chdir(self.tmpdir.name)
+
+    def tearDown(self):
+        os.chdir(self.old_cwd)
+        self.tmpdir.cleanup()
+
+    def write_head(self, content):
+        os.mkdir(".git")
+        with open(os.path.join(".git", "HEAD"), "w", encoding="utf-8") as f:
+            f.write(content)
+
+    def test_branch_ref(self):
+        """A symbolic ref should return the branch name."""
+        self.write_head("ref: refs/heads/main\n")
+        self.assertEqual(hook.get_current_branch(), "main")
+
+    def test_detached_head(self):
+        """A detached SHA should return an empty string."""
+        self.write_head("0123456789abcdef0123456789abcdef01234567\n")
+        self.assertEqual(hook.get_current_branch(), "")
+
+    def test_missing_head_falls_back_to_git(self):
+        """Without .git/HEAD it should ask git instead."""
+        result = subprocess.CompletedProcess(
+            args=[], returncode=0, stdout="feature/x\n", stderr=""
+        )
+        with mock.patch.object(hook.subprocess, "run", return_value=result) as run:
+            self.assertEqual(hook.get_current_branch(), "feature/x")
+        run.assert_called_once()
+        self.assertEqual(run.call_args.args[0], ["git", "branch", "--show-current"])
+
+
+if __name__ == "__main__":
+    unittest.main()
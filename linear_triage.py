@@ -12,14 +12,47 @@ import warnings
 warnings.filterwarnings("ignore", message=".*OpenSSL.*")
 
 import requests
-from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-load_dotenv()
+# Only import dotenv and read .env when the key isn't already exported
+if not os.getenv("LINEAR_API_KEY"):
+    from dotenv import load_dotenv
+
+    load_dotenv()
 
 LINEAR_API_URL = "https://api.linear.app/graphql"
 LINEAR_API_KEY = os.getenv("LINEAR_API_KEY")
 TEAM_KEY = "BEN"
 
+# (connect, read) seconds, so a stalled request fails instead of hanging
+REQUEST_TIMEOUT = (5, 30)
+
+# Retry rate limits and transient server errors, honoring Retry-After.
+# A long Retry-After is honored as-is (urllib3 doesn't cap it), so a heavily
+# rate-limited run can sleep for that long before giving up.
+# POST is safe to retry here because every request is a read-only query.
+# After the last attempt the response is returned, so the status check in
+# get_triage_issues() still reports it.
+RETRY = Retry(
+    total=3,
+    backoff_factor=0.5,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset({"POST"}),
+    respect_retry_after_header=True,
+    raise_on_status=False,
+)
+
+# One keep-alive connection shared by every Linear API call
+SESSION = requests.Session()
+SESSION.mount(
+    "https://",
+    HTTPAdapter(pool_connections=1, pool_maxsize=1, max_retries=RETRY),
+)
+if LINEAR_API_KEY:
+    # json= request bodies already get Content-Type: application/json
+    SESSION.headers["Authorization"] = LINEAR_API_KEY
+
 
 def get_team_and_triage_state():
     """Get team ID and triage state ID."""
@@ -39,12 +72,9 @@ def get_team_and_triage_state():
     }
     """
 
-    headers = {
-        "Authorization": LINEAR_API_KEY,
-        "Content-Type": "application/json",
-    }
-
-    response = requests.post(LINEAR_API_URL, json={"query": query}, headers=headers)
+    response = SESSION.post(
+        LINEAR_API_URL, json={"query": query}, timeout=REQUEST_TIMEOUT
+    )
     data = response.json()
 
     if "errors" in data:
@@ -100,15 +130,10 @@ def get_triage_issues():
     }
     """
 
-    headers = {
-        "Authorization": LINEAR_API_KEY,
-        "Content-Type": "application/json",
-    }
-
-    response = requests.post(
+    response = SESSION.post(
         LINEAR_API_URL,
         json={"query": query, "variables": {"stateId": triage_state_id}},
-        headers=headers,
+        timeout=REQUEST_TIMEOUT,
     )
 
     if response.status_code != 200:
@@ -145,25 +170,26 @@ def display_triage(data):
     team_name = data.get("_team_name", "Unknown")
     issues = data.get("data", {}).get("issues", {}).get("nodes", [])
 
-    print(f"\n=== {team_name} Triage ({len(issues)} issues) ===\n")
+    # Collect every line and write once instead of one print() per issue
+    lines = [f"\n=== {team_name} Triage ({len(issues)} issues) ===\n"]
 
     if not issues:
-        print("No issues in triage!")
-        return
-
-    for i, issue in enumerate(issues, 1):
-        priority = priority_badge(issue.get("priorityLabel", "No priority"))
-        identifier = issue.get("identifier", "???")
-        title = issue.get("title", "Untitled")
-        labels = issue.get("labels", {}).get("nodes", [])
-        label_str = ", ".join(l["name"] for l in labels) if labels else ""
-
-        line = f"{i:2}. [{priority:4}] {title} - #{identifier}"
-        if label_str:
-            line += f" ({label_str})"
-        print(line)
-
-    print()
+        lines.append("No issues in triage!")
+    else:
+        for i, issue in enumerate(issues, 1):
+            priority = priority_badge(issue.get("priorityLabel", "No priority"))
+            identifier = issue.get("identifier", "???")
+            title = issue.get("title", "Untitled")
+            labels = issue.get("labels", {}).get("nodes", [])
+            label_str = ", ".join(l["name"] for l in labels) if labels else ""
+
+            line = f"{i:2}. [{priority:4}] {title} - #{identifier}"
+            if label_str:
+                line += f" ({label_str})"
+            lines.append(line)
+        lines.append("")
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def main():